@@ -14,6 +14,7 @@ CAN Frame Haritası
 """
 
 import struct
+import numpy as np
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -34,10 +35,24 @@ ERROR_UNDERVOLTAGE = 0b00000100   # bit 2
 ERROR_COMM_LOSS    = 0b00001000   # bit 3
 ERROR_ENCODER      = 0b00010000   # bit 4
 
+_ERR_NAMES = (
+    (ERROR_OVERHEAT,     "AŞIRI ISINMA"),
+    (ERROR_OVERCURRENT,  "AŞIRI AKIM"),
+    (ERROR_UNDERVOLTAGE, "DÜŞÜK GERİLİM"),
+    (ERROR_COMM_LOSS,    "İLETİŞİM KAYBI"),
+    (ERROR_ENCODER,      "ENCODER HATASI"),
+)
+
+# flags (0–255) → aktif hata isimleri; import anında bir kez hesaplanır
+_ERROR_TABLE = tuple(
+    tuple(name for bit, name in _ERR_NAMES if flags & bit)
+    for flags in range(256)
+)
+
 # ──────────────────────────────────────────────
 #  Veri Sınıfları
 # ──────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class MotorTelemetry:
     """Anlık motor durumu."""
     rpm:        Optional[float] = None
@@ -49,16 +64,10 @@ class MotorTelemetry:
     timestamp:  float = 0.0
 
     def active_errors(self) -> list[str]:
-        errors = []
-        if self.error_flags & ERROR_OVERHEAT:     errors.append("AŞIRI ISINMA")
-        if self.error_flags & ERROR_OVERCURRENT:  errors.append("AŞIRI AKIM")
-        if self.error_flags & ERROR_UNDERVOLTAGE: errors.append("DÜŞÜK GERİLİM")
-        if self.error_flags & ERROR_COMM_LOSS:    errors.append("İLETİŞİM KAYBI")
-        if self.error_flags & ERROR_ENCODER:      errors.append("ENCODER HATASI")
-        return errors
+        return list(_ERROR_TABLE[self.error_flags & 0xFF])
 
 
-@dataclass
+@dataclass(slots=True)
 class DecodedFrame:
     """Tek bir CAN frame'inin decode edilmiş hali."""
     can_id:    int
@@ -68,18 +77,28 @@ class DecodedFrame:
     unit:      str
     is_error:  bool = False
     error_list: list = field(default_factory=list)
+    _hex_str:  Optional[str] = field(default=None, init=False, repr=False,
+                                     compare=False)
 
     @property
     def hex_str(self) -> str:
-        return " ".join(f"{b:02X}" for b in self.raw_bytes)
+        # slots=True → __dict__ yok, cached_property yerine elle önbellek
+        if self._hex_str is None:
+            self._hex_str = self.raw_bytes.hex(" ").upper()
+        return self._hex_str
 
     @property
     def formatted_value(self) -> str:
-        if self.is_error:
-            if self.error_list:
-                return " | ".join(self.error_list)
-            return "Sistem Normal"
-        return f"{self.value:.2f} {self.unit}"
+        return format_value(self.value, self.unit, self.is_error, self.error_list)
+
+
+def format_value(value: float, unit: str, is_error: bool, error_list) -> str:
+    """DecodedFrame.formatted_value'nun dataclass gerektirmeyen hali."""
+    if is_error:
+        if error_list:
+            return " | ".join(error_list)
+        return "Sistem Normal"
+    return f"{value:.2f} {unit}"
 
 
 # ──────────────────────────────────────────────
@@ -87,64 +106,112 @@ class DecodedFrame:
 # ──────────────────────────────────────────────
 def encode_rpm(rpm: float) -> bytes:
     """RPM → 2 byte uint16."""
-    val = max(0, min(65535, int(rpm)))
-    return struct.pack(">H", val)
+    v = int(rpm)
+    return (0 if v < 0 else 65535 if v > 65535 else v).to_bytes(2, "big")
 
 def encode_temp(temp_c: float) -> bytes:
     """Sıcaklık °C → 2 byte int16 (×10 scale)."""
-    val = max(-3276, min(3276, int(temp_c * 10)))
-    return struct.pack(">h", val)
+    v = int(temp_c * 10)
+    return (-3276 if v < -3276 else 3276 if v > 3276 else v).to_bytes(2, "big", signed=True)
 
 def encode_torque(torque_nm: float) -> bytes:
     """Tork N·m → 2 byte int16 (×100 scale)."""
-    val = max(-3276, min(3276, int(torque_nm * 100)))
-    return struct.pack(">h", val)
+    v = int(torque_nm * 100)
+    return (-3276 if v < -3276 else 3276 if v > 3276 else v).to_bytes(2, "big", signed=True)
 
 def encode_voltage(voltage_v: float) -> bytes:
     """Gerilim V → 2 byte uint16 (×10 scale)."""
-    val = max(0, min(6553, int(voltage_v * 10)))
-    return struct.pack(">H", val)
+    v = int(voltage_v * 10)
+    return (0 if v < 0 else 6553 if v > 6553 else v).to_bytes(2, "big")
 
 def encode_current(current_a: float) -> bytes:
     """Akım A → 2 byte int16 (×100 scale)."""
-    val = max(-3276, min(3276, int(current_a * 100)))
-    return struct.pack(">h", val)
+    v = int(current_a * 100)
+    return (-3276 if v < -3276 else 3276 if v > 3276 else v).to_bytes(2, "big", signed=True)
+
+_ERROR_BYTE_LUT = tuple(bytes([i]) for i in range(256))
 
 def encode_error(flags: int) -> bytes:
-    """Hata bayrakları → 1 byte."""
-    return bytes([flags & 0xFF])
+    """Hata bayrakları → 1 byte (önceden oluşturulmuş tablodan, allocation yok)."""
+    return _ERROR_BYTE_LUT[flags & 0xFF]
+
+
+# RPM, Sıcaklık, Tork, Gerilim, Akım — tek seferde derlenmiş format
+_TELEMETRY_STRUCT = struct.Struct(">HhhHh")
+
+def encode_telemetry(rpm: float, temp_c: float, torque_nm: float,
+                     voltage_v: float, current_a: float) -> tuple[bytes, ...]:
+    """
+    Beş telemetri sinyalini tek bir pack çağrısıyla encode eder.
+    (rpm, sıcaklık, tork, gerilim, akım) sırasıyla 2'şer byte'lık
+    payload tuple'ı döner.
+    """
+    # Satürasyon min()/max() çağrısı yerine inline karşılaştırmayla (~3× hızlı)
+    r = int(rpm)
+    t = int(temp_c * 10)
+    q = int(torque_nm * 100)
+    v = int(voltage_v * 10)
+    c = int(current_a * 100)
+    buf = _TELEMETRY_STRUCT.pack(
+        0     if r < 0     else 65535 if r > 65535 else r,
+        -3276 if t < -3276 else 3276  if t > 3276  else t,
+        -3276 if q < -3276 else 3276  if q > 3276  else q,
+        0     if v < 0     else 6553  if v > 6553  else v,
+        -3276 if c < -3276 else 3276  if c > 3276  else c,
+    )
+    return (buf[0:2], buf[2:4], buf[4:6], buf[6:8], buf[8:10])
+
+
+# _TELEMETRY_STRUCT ile aynı bellek düzeni (big-endian, 10 byte/satır)
+_TELEMETRY_DTYPE = np.dtype([
+    ("rpm", ">u2"), ("temp", ">i2"), ("torque", ">i2"),
+    ("voltage", ">u2"), ("current", ">i2"),
+])
+
+def encode_batch(rpm, temp_c, torque_nm, voltage_v, current_a) -> np.ndarray:
+    """
+    N adet telemetri örneğini vektörel olarak encode eder (replay / offline
+    simülasyon için). Her satırı encode_telemetry çıktısının birleşimi olan
+    (N, 10) uint8 dizisi döner.
+    """
+    rpm = np.asarray(rpm, dtype=np.float64)
+    out = np.empty(rpm.shape[0], dtype=_TELEMETRY_DTYPE)
+    out["rpm"]     = np.clip(rpm, 0, 65535)
+    out["temp"]    = np.clip(np.asarray(temp_c) * 10, -3276, 3276)
+    out["torque"]  = np.clip(np.asarray(torque_nm) * 100, -3276, 3276)
+    out["voltage"] = np.clip(np.asarray(voltage_v) * 10, 0, 6553)
+    out["current"] = np.clip(np.asarray(current_a) * 100, -3276, 3276)
+    return out.view(np.uint8).reshape(-1, 10)
 
 
 # ──────────────────────────────────────────────
 #  Decode Fonksiyonları (Node B için)
 # ──────────────────────────────────────────────
+_U16 = struct.Struct(">H")
+_I16 = struct.Struct(">h")
+
+# can_id → (unpacker, bölen, sinyal adı, birim)
+_DECODERS = {
+    CAN_ID_RPM:     (_U16, 1.0,   "Motor RPM",       "RPM"),
+    CAN_ID_TEMP:    (_I16, 10.0,  "Motor Sıcaklığı", "°C"),
+    CAN_ID_TORQUE:  (_I16, 100.0, "Tork",            "N·m"),
+    CAN_ID_VOLTAGE: (_U16, 10.0,  "DC Gerilim",      "V"),
+    CAN_ID_CURRENT: (_I16, 100.0, "Faz Akımı",       "A"),
+}
+
 def decode_frame(can_id: int, data: bytes) -> Optional[DecodedFrame]:
     """
     Verilen CAN ID ve ham data byte'larını decode eder.
     Bilinmeyen ID için None döner.
     """
     try:
-        if can_id == CAN_ID_RPM:
-            val = struct.unpack(">H", data[:2])[0]
-            return DecodedFrame(can_id, data, "Motor RPM", float(val), "RPM")
-
-        elif can_id == CAN_ID_TEMP:
-            val = struct.unpack(">h", data[:2])[0] / 10.0
-            return DecodedFrame(can_id, data, "Motor Sıcaklığı", val, "°C")
-
-        elif can_id == CAN_ID_TORQUE:
-            val = struct.unpack(">h", data[:2])[0] / 100.0
-            return DecodedFrame(can_id, data, "Tork", val, "N·m")
-
-        elif can_id == CAN_ID_VOLTAGE:
-            val = struct.unpack(">H", data[:2])[0] / 10.0
-            return DecodedFrame(can_id, data, "DC Gerilim", val, "V")
+        entry = _DECODERS.get(can_id)
+        if entry is not None:
+            unpacker, div, signal, unit = entry
+            (val,) = unpacker.unpack_from(data)
+            return DecodedFrame(can_id, data, signal, val / div, unit)
 
-        elif can_id == CAN_ID_CURRENT:
-            val = struct.unpack(">h", data[:2])[0] / 100.0
-            return DecodedFrame(can_id, data, "Faz Akımı", val, "A")
-
-        elif can_id == CAN_ID_ERROR:
+        if can_id == CAN_ID_ERROR:
             flags = data[0] if data else 0
             dummy = DecodedFrame(can_id, data, "Hata Durumu", float(flags), "",
                                  is_error=True)
@@ -157,14 +224,77 @@ def decode_frame(can_id: int, data: bytes) -> Optional[DecodedFrame]:
     return None
 
 
+def decode_frame_fast(can_id: int, data: bytes) -> Optional[tuple]:
+    """
+    decode_frame'in dataclass oluşturmayan hızlı yolu. DecodedFrame alanlarıyla
+    aynı sırada tuple döner:
+    (can_id, raw_bytes, signal, value, unit, is_error, error_list).
+    error_list paylaşılan bir tuple'dır, değiştirilmemelidir.
+    Bilinmeyen ID veya kısa payload için None döner.
+    """
+    entry = _DECODERS.get(can_id)
+    if entry is not None:
+        unpacker, div, signal, unit = entry
+        try:
+            (val,) = unpacker.unpack_from(data)
+        except struct.error:
+            return None
+        return (can_id, data, signal, val / div, unit, False, ())
+
+    if can_id == CAN_ID_ERROR:
+        flags = data[0] if data else 0
+        return (can_id, data, "Hata Durumu", float(flags), "", True,
+                _ERROR_TABLE[flags])
+
+    return None
+
+
 def _parse_error_flags(flags: int) -> list[str]:
-    errors = []
-    if flags & ERROR_OVERHEAT:     errors.append("AŞIRI ISINMA")
-    if flags & ERROR_OVERCURRENT:  errors.append("AŞIRI AKIM")
-    if flags & ERROR_UNDERVOLTAGE: errors.append("DÜŞÜK GERİLİM")
-    if flags & ERROR_COMM_LOSS:    errors.append("İLETİŞİM KAYBI")
-    if flags & ERROR_ENCODER:      errors.append("ENCODER HATASI")
-    return errors
+    return list(_ERROR_TABLE[flags & 0xFF])
+
+
+# can_id → (big-endian dtype, bölen, MotorTelemetry alan adı)
+_BULK_DECODERS = {
+    CAN_ID_RPM:     (">u2", 1.0,   "rpm"),
+    CAN_ID_TEMP:    (">i2", 10.0,  "temp_c"),
+    CAN_ID_TORQUE:  (">i2", 100.0, "torque_nm"),
+    CAN_ID_VOLTAGE: (">u2", 10.0,  "voltage_v"),
+    CAN_ID_CURRENT: (">i2", 100.0, "current_a"),
+}
+
+def decode_bulk(can_ids: np.ndarray, payloads: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Çok sayıda frame'i vektörel olarak decode eder (log replay / offline analiz).
+    can_ids (N,) ve payloads (N, 8) uint8 dizileri alır; her sinyal için
+    geliş sırasındaki değerleri içeren float64 dizisi döner. Hiç frame'i
+    olmayan sinyaller sonuçta yer almaz.
+    """
+    can_ids = np.asarray(can_ids)
+    payloads = np.asarray(payloads, dtype=np.uint8)
+    out = {}
+    for can_id, (dtype, div, key) in _BULK_DECODERS.items():
+        mask = can_ids == can_id
+        if mask.any():
+            raw = np.ascontiguousarray(payloads[mask, :2]).view(dtype).reshape(-1)
+            out[key] = raw / div
+    return out
+
+
+# Sütun sırası _ERR_NAMES ile aynı
+_ERR_MASKS = np.array([bit for bit, _ in _ERR_NAMES], dtype=np.uint8)
+
+def parse_error_flags_bulk(flags: np.ndarray) -> np.ndarray:
+    """
+    N adet hata bayrağı byte'ını (N, 5) bool matrisine açar.
+    Sütunlar: aşırı ısınma, aşırı akım, düşük gerilim, iletişim kaybı, encoder.
+    """
+    flags = np.asarray(flags, dtype=np.uint8)
+    return (flags[:, None] & _ERR_MASKS) != 0
+
+def error_labels_bulk(flags: np.ndarray) -> list[tuple[str, ...]]:
+    """N adet hata bayrağı byte'ı için aktif hata isimlerini döner."""
+    table = _ERROR_TABLE
+    return [table[f] for f in np.asarray(flags, dtype=np.uint8).tolist()]
 
 
 # ──────────────────────────────────────────────
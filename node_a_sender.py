@@ -10,21 +10,33 @@ Her 100ms'de bir paket gönderilir.
 
 import time
 import math
-import random
+import queue
+import collections
+import numpy as np
 import can
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.text import Text
+from rich.text import Text, Span
 from rich.live import Live
 from rich.table import Table
 from rich.style import Style
 import threading
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:          # numba opsiyonel — yoksa saf Python çalışır
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 from can_protocol import (
     CAN_ID_RPM, CAN_ID_TEMP, CAN_ID_TORQUE,
     CAN_ID_VOLTAGE, CAN_ID_CURRENT, CAN_ID_ERROR,
-    encode_rpm, encode_temp, encode_torque,
-    encode_voltage, encode_current, encode_error,
+    encode_telemetry, encode_error,
     ERROR_OVERHEAT, ERROR_OVERCURRENT, ERROR_UNDERVOLTAGE,
 )
 
@@ -34,6 +46,7 @@ console = Console()
 SEND_INTERVAL   = 0.10   # saniye (100 ms)
 SIM_SPEED       = 1.0    # Simülasyon hızı çarpanı
 ERROR_PROB      = 0.04   # Hata frame'i yayınlama olasılığı
+NOISE_BUF_SIZE  = 8192   # Önceden üretilen gürültü örneği sayısı
 
 # ── Renk Paleti ───────────────────────────────────────────────────
 COLOR_NORMAL    = "bright_green"
@@ -42,6 +55,78 @@ COLOR_ERROR     = "bright_red"
 COLOR_HEX       = "cyan"
 COLOR_ID        = "magenta"
 COLOR_TIMESTAMP = "bright_black"
+LOG_REFRESH_HZ  = 10     # Live log paneli yenileme hızı
+
+# ── Sinüs tablosu (math.sin yerine LUT + lineer interpolasyon) ────
+_SIN_LUT_SIZE = 4096
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT_STEP = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = np.sin(np.linspace(0, 2 * math.pi, _SIN_LUT_SIZE, endpoint=False))
+if not HAVE_NUMBA:
+    _SIN_LUT = _SIN_LUT.tolist()   # saf Python'da list indeksleme daha hızlı
+
+# ── Log satırının sabit başlığı: "[HH:MM:SS] ID:0x1FF │ " ────────
+_LOG_PREFIX_SPANS = (
+    Span(0,  11, COLOR_TIMESTAMP),
+    Span(11, 20, COLOR_ID),
+    Span(20, 22, "bright_black"),
+)
+
+
+@njit(cache=True)
+def fastsin(x: float) -> float:
+    """Tablodan lineer interpolasyonlu sinüs (hata < 1e-6)."""
+    i = (x * _SIN_LUT_STEP) % _SIN_LUT_SIZE
+    i0 = int(i)
+    lo = _SIN_LUT[i0 & _SIN_LUT_MASK]
+    return lo + (i - i0) * (_SIN_LUT[(i0 + 1) & _SIN_LUT_MASK] - lo)
+
+
+@njit(cache=True)
+def simulate_step(t: float, rpm_base: float, error_prob: float,
+                  gauss, uni, gi: int, ui: int) -> tuple:
+    """
+    Tek bir simülasyon adımı: (rpm, sıcaklık, tork, gerilim, akım, hata bayrakları).
+    numba kuruluysa native koda derlenir, değilse saf Python olarak çalışır.
+
+    Gürültü dışarıdan verilir: gauss[gi:gi+5] N(0,1), uni[ui:ui+2] U(0,1).
+    """
+    # RPM — sinüs bazlı değişken devir: 800–2500 arası
+    wave = fastsin(t * 0.3) * 0.5 + fastsin(t * 0.07) * 0.3
+    rpm = max(0.0, rpm_base + wave * 850 + gauss[gi] * 15)
+
+    # Sıcaklık — RPM'e bağlı ısınma + soğuma
+    load_factor = rpm / 2500.0
+    ambient = 25.0
+    heat_rise = load_factor * 55.0
+    oscillation = fastsin(t * 0.05) * 3.0
+    temp = ambient + heat_rise + oscillation + gauss[gi + 1] * 0.5
+
+    # Tork — sabit 7.5 kW güçten (N·m)
+    power_kw = 7.5
+    if rpm < 1.0:
+        torq = 0.0
+    else:
+        torq = (power_kw * 1000 * 60) / (2 * math.pi * rpm)
+        torq = max(0.0, torq + gauss[gi + 2] * 0.3)
+
+    # DC Bus gerilimi: 540–560 V arası
+    volt = 550.0 + fastsin(t * 0.15) * 8.0 + gauss[gi + 3] * 1.0
+
+    # Motor akımı (tork / moment sabiti)
+    kt = 2.1
+    curr = max(0.0, torq / kt + gauss[gi + 4] * 0.05)
+
+    # Gerçek koşullara göre hata bayrakları
+    flags = 0
+    if temp > 80.0:   flags |= ERROR_OVERHEAT
+    if curr > 5.0:    flags |= ERROR_OVERCURRENT
+    if volt < 520.0:  flags |= ERROR_UNDERVOLTAGE
+    # Rastgele geçici hata:
+    if uni[ui] < error_prob:
+        flags |= ERROR_OVERCURRENT if uni[ui + 1] < 0.5 else ERROR_UNDERVOLTAGE
+
+    return rpm, temp, torq, volt, curr, flags
 
 
 class MotorSimulator:
@@ -51,73 +136,65 @@ class MotorSimulator:
         self.t = 0.0
         self.rpm_base = 1500.0
         self.load = 0.5
-
-    def step(self, dt: float):
+        self._rng = np.random.default_rng()
+        self._refill_noise()
+
+    def _refill_noise(self):
+        """Gürültü rezervuarını tek bir vektörel çağrıyla yeniden doldurur."""
+        gauss = self._rng.standard_normal(NOISE_BUF_SIZE)
+        uni   = self._rng.random(NOISE_BUF_SIZE)
+        if not HAVE_NUMBA:
+            gauss, uni = gauss.tolist(), uni.tolist()
+        self._gauss, self._uni = gauss, uni
+        self._gi = self._ui = 0
+
+    def step(self, dt: float) -> tuple:
+        """Zamanı ilerletir ve o anki telemetri değerlerini döner."""
         self.t += dt
+        if self._gi + 5 > NOISE_BUF_SIZE:     # uni daha yavaş tükenir (2 < 5)
+            self._refill_noise()
+        out = simulate_step(self.t, self.rpm_base, ERROR_PROB,
+                            self._gauss, self._uni, self._gi, self._ui)
+        self._gi += 5
+        self._ui += 2
+        return out
+
+
+_ts_sec = -1
+_ts_str = ""
 
-    def rpm(self) -> float:
-        """Sinüs bazlı değişken RPM: 800–2500 arası."""
-        wave = math.sin(self.t * 0.3) * 0.5 + math.sin(self.t * 0.07) * 0.3
-        base_rpm = self.rpm_base + wave * 850
-        noise = random.gauss(0, 15)
-        return max(0, base_rpm + noise)
-
-    def temperature(self, current_rpm: float) -> float:
-        """RPM'e bağlı sıcaklık artışı + soğuma simülasyonu."""
-        load_factor = current_rpm / 2500.0
-        ambient = 25.0
-        heat_rise = load_factor * 55.0
-        oscillation = math.sin(self.t * 0.05) * 3.0
-        noise = random.gauss(0, 0.5)
-        return ambient + heat_rise + oscillation + noise
-
-    def torque(self, current_rpm: float) -> float:
-        """Güç sabiti ile tork (N·m)."""
-        power_kw = 7.5  # Sabit 7.5 kW motor
-        if current_rpm < 1.0:
-            return 0.0
-        torque = (power_kw * 1000 * 60) / (2 * math.pi * current_rpm)
-        noise = random.gauss(0, 0.3)
-        return max(0, torque + noise)
-
-    def voltage(self) -> float:
-        """DC Bus gerilimi: 540–560 V arası."""
-        return 550.0 + math.sin(self.t * 0.15) * 8.0 + random.gauss(0, 1.0)
-
-    def current(self, torque_nm: float) -> float:
-        """Motor akımı (tork / moment sabitinden)."""
-        kt = 2.1  # Motor moment sabiti
-        return max(0, torque_nm / kt + random.gauss(0, 0.05))
-
-    def error_flags(self, temp_c: float, current_a: float, voltage_v: float) -> int:
-        """Gerçek koşullara göre hata bayraklarını oluştur."""
-        flags = 0
-        if temp_c > 80.0:       flags |= ERROR_OVERHEAT
-        if current_a > 5.0:     flags |= ERROR_OVERCURRENT
-        if voltage_v < 520.0:   flags |= ERROR_UNDERVOLTAGE
-        # Rastgele geçici hata:
-        if random.random() < ERROR_PROB:
-            flags |= random.choice([ERROR_OVERCURRENT, ERROR_UNDERVOLTAGE])
-        return flags
+def _now_hms() -> str:
+    """HH:MM:SS — saniye değişmedikçe önbellekteki string döner."""
+    global _ts_sec, _ts_str
+    sec = int(time.time())
+    if sec != _ts_sec:
+        _ts_sec = sec
+        _ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _ts_str
 
 
 def format_hex_log(can_id: int, data: bytes, signal: str, value: str, has_error: bool) -> Text:
     """Terminal'de tek satır log formatı oluşturur."""
-    ts = time.strftime("%H:%M:%S")
-    hex_data = " ".join(f"{b:02X}" for b in data)
-
+    hex_col = f"{data.hex(' ').upper():<23}"
+    sig_col = f"{signal:<18}"
     color = COLOR_ERROR if has_error else COLOR_NORMAL
 
-    line = Text()
-    line.append(f"[{ts}] ", style=COLOR_TIMESTAMP)
-    line.append(f"ID:0x{can_id:03X} ", style=COLOR_ID)
-    line.append("│ ", style="bright_black")
-    line.append(f"{hex_data:<23}", style=COLOR_HEX)
-    line.append(" │ ", style="bright_black")
-    line.append(f"{signal:<18}", style="white")
-    line.append(" → ", style="bright_black")
-    line.append(value, style=color)
-    return line
+    # Satır tek f-string ile kurulur, stiller hazır span'lerle verilir
+    plain = f"[{_now_hms()}] ID:0x{can_id:03X} │ {hex_col} │ {sig_col} → {value}"
+    h1 = 22 + len(hex_col)
+    s0 = h1 + 3
+    s1 = s0 + len(sig_col)
+    v0 = s1 + 3
+
+    spans = list(_LOG_PREFIX_SPANS)
+    spans += (
+        Span(22, h1, COLOR_HEX),
+        Span(h1, s0, "bright_black"),
+        Span(s0, s1, "white"),
+        Span(s1, v0, "bright_black"),
+        Span(v0, len(plain), color),
+    )
+    return Text(plain, spans=spans)
 
 
 def make_status_table(rpm, temp, torq, volt, curr, err_flags):
@@ -149,6 +226,43 @@ def make_status_table(rpm, temp, torq, volt, curr, err_flags):
     return table
 
 
+def tx_worker(bus: can.BusABC, tx_queue: queue.SimpleQueue,
+              log_lines: collections.deque, live: Live):
+    """
+    Ayrı thread'de kuyruktaki frame'leri bus'a gönderir ve log paneline ekler.
+    Kuyruğa None konduğunda çıkar.
+
+    Her CAN ID için tek bir can.Message tutulur ve sadece data alanı
+    güncellenir. Mesajlara yalnızca bu thread dokunduğu ve send() senkron
+    serialize ettiği için yeniden kullanım güvenlidir.
+    """
+    msg_cache = {
+        can_id: can.Message(arbitration_id=can_id, data=bytes(2), is_extended_id=False)
+        for can_id in (CAN_ID_RPM, CAN_ID_TEMP, CAN_ID_TORQUE,
+                       CAN_ID_VOLTAGE, CAN_ID_CURRENT)
+    }
+    msg_cache[CAN_ID_ERROR] = can.Message(arbitration_id=CAN_ID_ERROR, data=bytes(1),
+                                          is_extended_id=False)
+
+    while True:
+        item = tx_queue.get()
+        if item is None:
+            break
+
+        can_id, data, line = item
+        msg = msg_cache[can_id]
+        msg.data = data
+        msg.dlc  = len(data)
+        try:
+            bus.send(msg)
+        except can.CanError as e:
+            console.print(f"[red]Gönderme hatası: {e}[/red]")
+
+        log_lines.append(line)
+        if tx_queue.empty():
+            live.update(Group(*log_lines))
+
+
 def main():
     console.print(Panel(
         "[bold bright_cyan]🏭 ENDÜSTRİYEL CANbus SİMÜLATÖR[/bold bright_cyan]\n"
@@ -167,69 +281,58 @@ def main():
         return
 
     sim = MotorSimulator()
+    sim.step(0.0)   # JIT derlemesini döngü dışında yap
     frame_count = 0
-    log_lines: list[Text] = []
     MAX_LOG = 25
+    log_lines: collections.deque[Text] = collections.deque(maxlen=MAX_LOG)
 
     console.print("[bright_green]✓ Virtual CAN Bus bağlantısı kuruldu.[/bright_green]")
     console.print("[bright_black]─" * 65 + "[/bright_black]")
     console.print("[bold white]Akan CAN Frame'leri:[/bold white]\n")
 
+    # Log satırları frame başına print edilmez; Live kendi saatinde yeniler
+    live = Live(Group(), console=console, refresh_per_second=LOG_REFRESH_HZ)
+    live.start()
+
+    # Gönderim + log I/O'su simülasyon döngüsünü bloklamasın
+    tx_queue: queue.SimpleQueue = queue.SimpleQueue()
+    tx_thread = threading.Thread(
+        target=tx_worker,
+        args=(bus, tx_queue, log_lines, live),
+    )
+    tx_thread.start()
+
+    next_deadline = time.perf_counter()
+
     try:
         while True:
-            loop_start = time.perf_counter()
-            sim.step(SEND_INTERVAL)
-
             # ── Anlık değerleri hesapla ──────────────────────────
-            rpm    = sim.rpm()
-            temp   = sim.temperature(rpm)
-            torq   = sim.torque(rpm)
-            volt   = sim.voltage()
-            curr   = sim.current(torq)
-            flags  = sim.error_flags(temp, curr, volt)
+            rpm, temp, torq, volt, curr, flags = sim.step(SEND_INTERVAL)
 
             # ── Frame'leri gönder ────────────────────────────────
+            d_rpm, d_temp, d_torq, d_volt, d_curr = encode_telemetry(
+                rpm, temp, torq, volt, curr
+            )
             frames_to_send = [
-                (CAN_ID_RPM,     encode_rpm(rpm),        f"{rpm:.0f} RPM",     False),
-                (CAN_ID_TEMP,    encode_temp(temp),       f"{temp:.1f} °C",     temp > 78),
-                (CAN_ID_TORQUE,  encode_torque(torq),     f"{torq:.2f} N·m",    False),
-                (CAN_ID_VOLTAGE, encode_voltage(volt),    f"{volt:.1f} V",      volt < 520),
-                (CAN_ID_CURRENT, encode_current(curr),    f"{curr:.2f} A",      curr > 5.5),
+                (CAN_ID_RPM,     d_rpm,   "Motor RPM",   f"{rpm:.0f} RPM",     False),
+                (CAN_ID_TEMP,    d_temp,  "Sıcaklık",    f"{temp:.1f} °C",     temp > 78),
+                (CAN_ID_TORQUE,  d_torq,  "Tork",        f"{torq:.2f} N·m",    False),
+                (CAN_ID_VOLTAGE, d_volt,  "DC Gerilim",  f"{volt:.1f} V",      volt < 520),
+                (CAN_ID_CURRENT, d_curr,  "Faz Akımı",   f"{curr:.2f} A",      curr > 5.5),
             ]
 
-            for can_id, data, val_str, is_warn in frames_to_send:
-                msg = can.Message(arbitration_id=can_id, data=data, is_extended_id=False)
-                try:
-                    bus.send(msg)
-                except can.CanError as e:
-                    console.print(f"[red]Gönderme hatası: {e}[/red]")
-
-                signal_name = {
-                    CAN_ID_RPM: "Motor RPM", CAN_ID_TEMP: "Sıcaklık",
-                    CAN_ID_TORQUE: "Tork", CAN_ID_VOLTAGE: "DC Gerilim",
-                    CAN_ID_CURRENT: "Faz Akımı",
-                }.get(can_id, "?")
-
+            for can_id, data, signal_name, val_str, is_warn in frames_to_send:
                 line = format_hex_log(can_id, data, signal_name, val_str, is_warn)
-                log_lines.append(line)
-                console.print(line)
+                tx_queue.put((can_id, data, line))
 
             # ── Hata frame'i ─────────────────────────────────────
             if flags != 0:
                 err_data = encode_error(flags)
-                err_msg  = can.Message(arbitration_id=CAN_ID_ERROR, data=err_data,
-                                       is_extended_id=False)
-                try:
-                    bus.send(err_msg)
-                except can.CanError:
-                    pass
-
                 err_line = format_hex_log(
                     CAN_ID_ERROR, err_data, "HATA BAYRAĞ",
                     f"FLAGS=0x{flags:02X}", True
                 )
-                console.print(err_line)
-                log_lines.append(err_line)
+                tx_queue.put((CAN_ID_ERROR, err_data, err_line))
 
             frame_count += 1
 
@@ -239,14 +342,20 @@ def main():
                 console.print(make_status_table(rpm, temp, torq, volt, curr, flags))
                 console.print()
 
-            # ── 100 ms döngüsünü koru ─────────────────────────────
-            elapsed = time.perf_counter() - loop_start
-            sleep_t = max(0, SEND_INTERVAL - elapsed)
-            time.sleep(sleep_t)
+            # ── 100 ms döngüsünü koru (mutlak deadline, drift yok) ─
+            next_deadline += SEND_INTERVAL
+            delay = next_deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_deadline = time.perf_counter()  # geride kaldık, yakalamaya çalışma
 
     except KeyboardInterrupt:
         console.print("\n[yellow]⏹  Simülatör durduruldu.[/yellow]")
     finally:
+        tx_queue.put(None)
+        tx_thread.join()
+        live.stop()
         bus.shutdown()
         console.print(f"[bright_black]Toplam {frame_count * 5} frame gönderildi.[/bright_black]")
 
@@ -10,10 +10,12 @@ Sanal CAN bus'ı dinler, hex frame'leri decode eder ve iki panelde gösterir:
     2. Sonra simülatörü başlat → python node_a_sender.py
 """
 
+import os
 import time
+import math
 import threading
-import queue
 import collections
+from dataclasses import dataclass
 import tkinter as tk
 from tkinter import ttk
 import can
@@ -28,7 +30,7 @@ from datetime import datetime
 import numpy as np
 
 from can_protocol import (
-    decode_frame,
+    decode_frame_fast, format_value,
     CAN_ID_RPM, CAN_ID_TEMP, CAN_ID_TORQUE,
     CAN_ID_VOLTAGE, CAN_ID_CURRENT, CAN_ID_ERROR,
 )
@@ -39,8 +41,14 @@ from can_protocol import (
 WINDOW_SECONDS  = 60       # Grafiklerde kaç saniyelik veri tutulur
 MAX_LOG_LINES   = 200      # Terminal log'da max satır sayısı
 UPDATE_MS       = 200      # GUI güncelleme aralığı (ms)
+KPI_EVERY       = 2        # KPI kartları her N tick'te bir güncellenir (~400 ms)
 GRAPH_ALPHA     = 0.85
+Y_SHRINK_RATIO  = 3.0      # Y ekseni ancak veri aralığının bu katından genişse daralır
 LINE_WIDTH      = 1.6
+MAX_PLOT_POINTS = 500      # Eksen başına çizilecek en fazla nokta (~eksen genişliği px)
+RECV_BURST_MAX  = 256      # Tek turda bus'tan boşaltılacak en fazla frame
+LISTENER_RT_PRIO = 20      # Listener thread'i için SCHED_FIFO önceliği (1-99)
+LISTENER_NICE    = -10     # SCHED_FIFO reddedilirse denenecek nice değeri
 
 # ── Renkler (koyu tema) ───────────────────────────────────────────
 BG_DARK    = "#0D1117"     # GitHub koyu arka plan
@@ -55,6 +63,15 @@ RED        = "#F85149"
 ORANGE     = "#DB6D28"
 PURPLE     = "#BC8CFF"
 
+SIGNAL_NAMES = {
+    CAN_ID_RPM:     "Motor RPM",
+    CAN_ID_TEMP:    "Sıcaklık",
+    CAN_ID_TORQUE:  "Tork",
+    CAN_ID_VOLTAGE: "DC Gerilim",
+    CAN_ID_CURRENT: "Faz Akımı",
+    CAN_ID_ERROR:   "⚠ HATA",
+}
+
 SIGNAL_COLORS = {
     CAN_ID_RPM:     GREEN,
     CAN_ID_TEMP:    ORANGE,
@@ -64,81 +81,179 @@ SIGNAL_COLORS = {
 }
 
 # ──────────────────────────────────────────────────────────────────
-#  Veri deposu (thread-safe deques)
+#  Veri deposu (thread-safe SoA ring buffer)
 # ──────────────────────────────────────────────────────────────────
 MAX_POINTS = 1000
 
+# Ring buffer satırları: 0 = zaman, 1.. = sinyaller
+_ROW_TIME = 0
+_SIGNAL_ROWS = {
+    CAN_ID_RPM:     1,
+    CAN_ID_TEMP:    2,
+    CAN_ID_TORQUE:  3,
+    CAN_ID_CURRENT: 4,
+    CAN_ID_VOLTAGE: 5,
+}
+_LATEST_KEYS = ("rpm", "temp", "torque", "current", "voltage")
+
 class DataStore:
+    """
+    Her sinyal için önceden ayrılmış bir satırı olan ring buffer.
+    RPM frame'i yeni bir örnek (zaman adımı) açar; diğer sinyaller o adımın
+    slotuna yazılır. Henüz gelmemiş sinyaller bir önceki değeri tutar.
+    """
+
     def __init__(self):
         self.lock = threading.Lock()
-        self.times     = collections.deque(maxlen=MAX_POINTS)
-        self.rpm       = collections.deque(maxlen=MAX_POINTS)
-        self.temp      = collections.deque(maxlen=MAX_POINTS)
-        self.torque    = collections.deque(maxlen=MAX_POINTS)
-        self.current   = collections.deque(maxlen=MAX_POINTS)
-        self.voltage   = collections.deque(maxlen=MAX_POINTS)
+        self._buf  = np.zeros((1 + len(_SIGNAL_ROWS), MAX_POINTS))
+        self._last = np.zeros(1 + len(_SIGNAL_ROWS))   # son değerler (satır sırası)
+        self._head = 0                                  # toplam açılan örnek sayısı
+        self.epoch = 0                                  # buffer her yazıldığında artar
         self.errors    : list[tuple] = []  # (time, flag_list)
 
         self.latest = {
-            "rpm": 0.0, "temp": 0.0, "torque": 0.0,
-            "current": 0.0, "voltage": 0.0, "errors": [],
+            "errors": [],
             "total_frames": 0, "error_frames": 0,
         }
 
     def push(self, can_id, value, t):
+        self.push_batch((can_id,), (value,), t)
+
+    def push_batch(self, can_ids, values, t):
+        """
+        Aynı anda alınmış bir frame grubunu tek lock alımıyla yazar.
+        CAN ID → satır eşlemesi tek bir tablo araması (_SIGNAL_ROWS); sıra
+        korunur, çünkü RPM frame'i sonraki sinyallerin yazılacağı slotu açar.
+        """
+        rows = [_SIGNAL_ROWS.get(can_id) for can_id in can_ids]
+        buf, last = self._buf, self._last
         with self.lock:
-            self.latest["total_frames"] += 1
-            now = t
-
-            if can_id == CAN_ID_RPM:
-                self.times.append(now)
-                self.rpm.append(value)
-                self.latest["rpm"] = value
-
-            elif can_id == CAN_ID_TEMP:
-                self.temp.append(value)
-                self.latest["temp"] = value
+            self.latest["total_frames"] += len(rows)
 
-            elif can_id == CAN_ID_TORQUE:
-                self.torque.append(value)
-                self.latest["torque"] = value
-
-            elif can_id == CAN_ID_CURRENT:
-                self.current.append(value)
-                self.latest["current"] = value
-
-            elif can_id == CAN_ID_VOLTAGE:
-                self.voltage.append(value)
-                self.latest["voltage"] = value
-
-            elif can_id == CAN_ID_ERROR:
-                self.latest["error_frames"] += 1
+            for can_id, row, value in zip(can_ids, rows, values):
+                if row is None:
+                    if can_id == CAN_ID_ERROR:
+                        self.latest["error_frames"] += 1
+                    continue
 
-    def snapshot(self):
+                last[row] = value
+                self.epoch += 1
+                if can_id == CAN_ID_RPM:
+                    last[_ROW_TIME] = t
+                    buf[:, self._head % MAX_POINTS] = last
+                    self._head += 1
+                else:
+                    buf[row, (self._head - 1) % MAX_POINTS] = value
+
+    def snapshot(self, since: float = -math.inf):
+        """
+        Zaman sıralı (times, rpm, temp, torque, current, voltage, latest) döner.
+        Sadece zamanı `since` ve sonrası olan örnekler kopyalanır; pencere başı
+        sıralı zaman satırında searchsorted ile bulunur. Diziler lock altında
+        alınmış kopyalardır; GUI thread'i güvenle kullanır.
+        """
+        with self.lock:
+            buf = self._buf
+            i = self._head % MAX_POINTS
+            if self._head <= MAX_POINTS:
+                k = int(np.searchsorted(buf[_ROW_TIME, :self._head], since))
+                data = buf[:, k:self._head].copy()
+            elif i > 0 and since >= buf[_ROW_TIME, 0]:
+                # Pencere tamamen sarılmış (yeni) kısımda
+                k = int(np.searchsorted(buf[_ROW_TIME, :i], since))
+                data = buf[:, k:i].copy()
+            else:
+                k = i + int(np.searchsorted(buf[_ROW_TIME, i:], since))
+                data = np.concatenate((buf[:, k:], buf[:, :i]), axis=1)
+            latest = dict(self.latest)
+            latest.update(zip(_LATEST_KEYS, self._last[1:].tolist()))
+
+        return (data[_ROW_TIME],
+                data[_SIGNAL_ROWS[CAN_ID_RPM]],
+                data[_SIGNAL_ROWS[CAN_ID_TEMP]],
+                data[_SIGNAL_ROWS[CAN_ID_TORQUE]],
+                data[_SIGNAL_ROWS[CAN_ID_CURRENT]],
+                data[_SIGNAL_ROWS[CAN_ID_VOLTAGE]],
+                latest)
+
+    def snapshot_latest(self) -> dict:
+        """Sadece son değerler ve sayaçlar — ring buffer kopyalanmaz."""
         with self.lock:
-            return (
-                list(self.times),
-                list(self.rpm),
-                list(self.temp),
-                list(self.torque),
-                list(self.current),
-                list(self.voltage),
-                dict(self.latest),
-            )
+            latest = dict(self.latest)
+            latest.update(zip(_LATEST_KEYS, self._last[1:].tolist()))
+        return latest
 
 
 # ──────────────────────────────────────────────────────────────────
 #  CAN Listener Thread
 # ──────────────────────────────────────────────────────────────────
-def can_listener_thread(store: DataStore, log_queue: queue.Queue, stop_event: threading.Event):
+def id_to_signal(can_id: int) -> str:
+    return SIGNAL_NAMES.get(can_id) or f"ID:0x{can_id:03X}"
+
+
+def format_log_row(can_id: int, data: bytes, value: str, numeric: float,
+                   is_err: bool) -> tuple:
+    """
+    Bir frame'in log satırını (zaman damgası hariç) Treeview'a hazır
+    ((id, hex, sinyal, değer), tag) olarak üretir.
+    Listener thread'inde çalışır; GUI thread'i sadece insert yapar.
+    """
+    is_hot = can_id == CAN_ID_TEMP and numeric > 78
+    val_tag = "error" if is_err else ("warn" if is_hot else "normal")
+
+    return (
+        (f"0x{can_id:03X}", data.hex(" ").upper(), id_to_signal(can_id), value),
+        val_tag,
+    )
+
+
+def raise_thread_priority() -> str:
+    """
+    Çağıran thread'i tek bir çekirdeğe sabitler ve önceliğini yükseltir;
+    böylece Tk/matplotlib çizimi sırasında frame alımı gecikmez.
+    Sadece Linux'ta çalışır; SCHED_FIFO ve negatif nice için CAP_SYS_NICE
+    (veya root) gerekir. İzin yoksa sessizce mevcut ayarlarla devam eder.
+    Sonucu log'a yazılacak kısa bir metin olarak döner.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return "öncelik ayarı bu platformda desteklenmiyor"
+
+    # pid 0 → Linux'ta çağıran thread; GUI thread'i bundan etkilenmez
+    parts = []
+    try:
+        cores = os.sched_getaffinity(0)
+        if len(cores) > 1:
+            core = max(cores)
+            os.sched_setaffinity(0, {core})
+            parts.append(f"CPU{core}")
+    except OSError:
+        pass
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(LISTENER_RT_PRIO))
+        parts.append(f"SCHED_FIFO/{LISTENER_RT_PRIO}")
+    except OSError:
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, LISTENER_NICE)
+            parts.append(f"nice {LISTENER_NICE}")
+        except OSError:
+            parts.append("varsayılan öncelik (CAP_SYS_NICE yok)")
+
+    return ", ".join(parts)
+
+
+def can_listener_thread(store: DataStore, log_queue: collections.deque, stop_event: threading.Event):
     """Ayrı thread'de virtual CAN bus'ı dinler."""
+    prio = raise_thread_priority()
+
     try:
         bus = can.Bus(interface='udp_multicast', channel='239.0.0.1')
     except Exception as e:
-        log_queue.put(("ERROR", 0, b"", f"CAN Bus bağlanamadı: {e}", True))
+        log_queue.append(("ERROR", f"CAN Bus bağlanamadı: {e}"))
         return
 
-    log_queue.put(("SYS", 0, b"", "✓ Virtual CAN Bus bağlandı — frame bekleniyor...", False))
+    log_queue.append(("SYS", "✓ Virtual CAN Bus bağlandı — frame bekleniyor..."))
+    log_queue.append(("SYS", f"Listener thread: {prio}"))
 
     while not stop_event.is_set():
         try:
@@ -146,27 +261,35 @@ def can_listener_thread(store: DataStore, log_queue: queue.Queue, stop_event: th
             if msg is None:
                 continue
 
-            t = time.time()
-            frame = decode_frame(msg.arbitration_id, bytes(msg.data))
+            # Soket tamponunda bekleyen frame'leri bloklamadan boşalt
+            msgs = [msg]
+            while len(msgs) < RECV_BURST_MAX:
+                msg = bus.recv(timeout=0.0)
+                if msg is None:
+                    break
+                msgs.append(msg)
+
+            t = time.monotonic()   # duvar saati atlamalarından etkilenmez
+            can_ids, values, records = [], [], []
+            for msg in msgs:
+                # Tuple dönen hızlı yol — frame başına dataclass oluşturulmaz
+                frame = decode_frame_fast(msg.arbitration_id, msg.data)
+                if frame is None:
+                    continue
 
-            if frame is None:
-                continue
+                can_id, raw, _, value, unit, is_error, errors = frame
+                can_ids.append(can_id)
+                values.append(value)
+                records.append(("FRAME", format_log_row(
+                    can_id, raw, format_value(value, unit, is_error, errors),
+                    value, is_error and bool(errors),
+                )))
 
-            # Veri deposuna ekle
-            store.push(msg.arbitration_id, frame.value, t)
+            # Veri deposuna tek lock alımıyla ekle
+            store.push_batch(can_ids, values, t)
 
-            # Log kuyruğuna ekle (blocking olmayan put)
-            is_err = frame.is_error and bool(frame.error_list)
-            try:
-                log_queue.put_nowait((
-                    "FRAME",
-                    msg.arbitration_id,
-                    bytes(msg.data),
-                    frame.formatted_value,
-                    is_err,
-                ))
-            except queue.Full:
-                pass  # Kuyruk doluysa frame'i at, GUI yavaş kalmasın
+            # Log kuyruğuna ekle — deque doluysa en eski kayıt düşer, GUI yavaş kalmaz
+            log_queue.extend(records)
 
         except can.CanError:
             continue
@@ -177,6 +300,17 @@ def can_listener_thread(store: DataStore, log_queue: queue.Queue, stop_event: th
 # ──────────────────────────────────────────────────────────────────
 #  Ana GUI Sınıfı
 # ──────────────────────────────────────────────────────────────────
+@dataclass(slots=True)
+class AxisSlot:
+    """Bir grafik ekseni ve üzerindeki hareketli artist'ler — bir kez kurulur."""
+    ax:    object
+    line:  object
+    unit:  str
+    ylim:  tuple
+    color: str
+    fill:  object
+
+
 class CANAnalyzerApp:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -186,12 +320,16 @@ class CANAnalyzerApp:
         self.root.minsize(1100, 650)
 
         self.store      = DataStore()
-        self.log_queue  = queue.Queue(maxsize=500)
+        # Tek üretici / tek tüketici: deque append/popleft GIL altında atomik
+        self.log_queue  = collections.deque(maxlen=500)
+        self._log_items = collections.deque()   # Treeview satır id'leri (eskiden yeniye)
         self.stop_event = threading.Event()
 
         self._build_ui()
         self._start_can_thread()
-        self._schedule_updates()
+        self._tick_count = 0
+        self._last_epoch = -1   # son çizilen DataStore.epoch
+        self._tick()
 
     # ── UI Builder ────────────────────────────────────────────────
     def _build_ui(self):
@@ -270,36 +408,39 @@ class CANAnalyzerApp:
                  font=("Consolas", 10, "bold"), fg=GREEN, bg=BG_PANEL,
                  padx=10).pack(side="left")
 
-        # Text widget + scrollbar
-        txt_frame = tk.Frame(frame, bg=BG_PANEL)
-        txt_frame.pack(fill="both", expand=True)
+        # Treeview + scrollbar — satır başına tek insert, tag satır bazında
+        tree_frame = tk.Frame(frame, bg=BG_PANEL)
+        tree_frame.pack(fill="both", expand=True)
 
-        scrollbar = ttk.Scrollbar(txt_frame)
+        scrollbar = ttk.Scrollbar(tree_frame)
         scrollbar.pack(side="right", fill="y")
 
-        self.log_text = tk.Text(
-            txt_frame,
-            bg=BG_DARK, fg=FG_WHITE,
-            font=("Consolas", 9),
-            wrap="none",
-            state="disabled",
+        self.log_tree = ttk.Treeview(
+            tree_frame,
+            columns=("ts", "id", "hex", "signal", "value"),
+            show="headings",
+            style="Log.Treeview",
+            selectmode="none",
             yscrollcommand=scrollbar.set,
-            selectbackground=BG_PANEL,
-            insertbackground=FG_WHITE,
-            bd=0, padx=8, pady=4,
         )
-        self.log_text.pack(fill="both", expand=True)
-        scrollbar.config(command=self.log_text.yview)
+        for col, title, width, stretch in (
+            ("ts",     "ZAMAN",  70,  False),
+            ("id",     "ID",     55,  False),
+            ("hex",    "HEX",    170, True),
+            ("signal", "SİNYAL", 110, True),
+            ("value",  "DEĞER",  90,  False),
+        ):
+            self.log_tree.heading(col, text=title, anchor="w")
+            self.log_tree.column(col, width=width, minwidth=40,
+                                 stretch=stretch, anchor="w")
+        self.log_tree.pack(fill="both", expand=True)
+        scrollbar.config(command=self.log_tree.yview)
 
         # Renk tag'leri
-        self.log_text.tag_configure("ts",       foreground="#555E6B", font=("Consolas", 8))
-        self.log_text.tag_configure("id",       foreground=PURPLE)
-        self.log_text.tag_configure("sep",      foreground="#30363D")
-        self.log_text.tag_configure("hex",      foreground=ACCENT)
-        self.log_text.tag_configure("normal",   foreground=GREEN)
-        self.log_text.tag_configure("warn",     foreground=YELLOW)
-        self.log_text.tag_configure("error",    foreground=RED, font=("Consolas", 9, "bold"))
-        self.log_text.tag_configure("sys",      foreground=YELLOW, font=("Consolas", 9, "italic"))
+        self.log_tree.tag_configure("normal",   foreground=GREEN)
+        self.log_tree.tag_configure("warn",     foreground=YELLOW)
+        self.log_tree.tag_configure("error",    foreground=RED, font=("Consolas", 9, "bold"))
+        self.log_tree.tag_configure("sys",      foreground=YELLOW, font=("Consolas", 9, "italic"))
 
     def _build_graph_panel(self, parent):
         """Sağ panel: matplotlib grafikleri."""
@@ -324,8 +465,7 @@ class CANAnalyzerApp:
             (gs[1, 1], "Faz Akımı",      "A",    ACCENT, (0, 8)),
         ]
 
-        self.axes  = []
-        self.lines = []
+        self.axes: list[AxisSlot] = []
 
         for gs_pos, title, unit, color, ylim in ax_defs:
             ax = self.fig.add_subplot(gs_pos)
@@ -338,17 +478,30 @@ class CANAnalyzerApp:
             for spine in ax.spines.values():
                 spine.set_edgecolor("#30363D")
 
+            # animated=True → arka plana çizilmez, blit ile güncellenir
             line, = ax.plot([], [], color=color, linewidth=LINE_WIDTH,
-                            alpha=GRAPH_ALPHA)
-            fill = ax.fill_between([], [], alpha=0.12, color=color)
+                            alpha=GRAPH_ALPHA, animated=True)
+            fill = ax.fill_between([], [], alpha=0.12, color=color, animated=True)
 
-            self.axes.append((ax, unit, ylim, color, fill))
-            self.lines.append(line)
+            self.axes.append(AxisSlot(ax, line, unit, ylim, color, fill))
 
         canvas = FigureCanvasTkAgg(self.fig, master=frame)
         canvas.get_tk_widget().pack(fill="both", expand=True, padx=4, pady=(0, 4))
         self.canvas = canvas
 
+        # Blit arka planları her tam çizimde (açılış, resize, eksen değişimi) yenilenir
+        self._backgrounds = None
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """Tam çizimden sonra statik arka planları yakala, hareketli çizgileri bas."""
+        self._backgrounds = [self.canvas.copy_from_bbox(slot.ax.bbox)
+                             for slot in self.axes]
+        for slot in self.axes:
+            slot.ax.draw_artist(slot.fill)
+            slot.ax.draw_artist(slot.line)
+        self.canvas.blit(self.fig.bbox)
+
     # ── Thread & Güncelleme ───────────────────────────────────────
     def _start_can_thread(self):
         t = threading.Thread(
@@ -358,130 +511,125 @@ class CANAnalyzerApp:
         )
         t.start()
 
-    def _schedule_updates(self):
-        self._update_log()
-        self._update_graphs()
-        self._update_kpis()
-
-    def _update_log(self):
-        """Kuyruktan log mesajlarını Text widget'a yazdır."""
+    def _tick(self):
+        """Tek zamanlayıcı: log, grafik ve (her KPI_EVERY tick'te) KPI güncellemesi."""
+        if not self.root.winfo_exists():
+            return
         try:
-            self.log_text.configure(state="normal")
-            count = 0
-
-            while count < 30:
-                try:
-                    kind, can_id, data, value, is_err = self.log_queue.get_nowait()
-                except queue.Empty:
-                    break
+            self._update_log()
+            # Yeni veri gelmediyse snapshot ve grafik işi tamamen atlanır
+            epoch = self.store.epoch
+            if epoch != self._last_epoch:
+                self._last_epoch = epoch
+                self._update_graphs(self.store.snapshot(time.monotonic() - WINDOW_SECONDS))
+            if self._tick_count % KPI_EVERY == 0:
+                self._update_kpis(self.store.snapshot_latest())
+            self._tick_count += 1
+        finally:
+            self.root.after(UPDATE_MS, self._tick)
 
-                ts = time.strftime("%H:%M:%S")
+    def _update_log(self):
+        """Kuyruktan log mesajlarını Treeview'a satır satır ekle."""
+        rows = []
+        ts = time.strftime("%H:%M:%S")   # bu boşaltma turundaki tüm satırlar için
 
-                if kind == "SYS":
-                    self.log_text.insert("end", f"[{ts}] {value}\n", "sys")
-                elif kind == "ERROR":
-                    self.log_text.insert("end", f"[{ts}] !! {value}\n", "error")
-                else:
-                    hex_str = " ".join(f"{b:02X}" for b in data)
-                    signal  = self._id_to_signal(can_id)
-                    try:
-                        is_hot = (can_id == CAN_ID_TEMP and float(value.split()[0]) > 78)
-                    except Exception:
-                        is_hot = False
-                    val_tag = "error" if is_err else ("warn" if is_hot else "normal")
-
-                    self.log_text.insert("end", f"[{ts}] ", "ts")
-                    self.log_text.insert("end", f"0x{can_id:03X}", "id")
-                    self.log_text.insert("end", " | ", "sep")
-                    self.log_text.insert("end", f"{hex_str:<23}", "hex")
-                    self.log_text.insert("end", " | ", "sep")
-                    self.log_text.insert("end", f"{signal:<16} -> ", "ts")
-                    self.log_text.insert("end", f"{value}\n", val_tag)
-
-                count += 1
-
-            # Satır sınırı
+        while len(rows) < 30:
             try:
-                lines = int(self.log_text.index("end-1c").split(".")[0])
-                if lines > MAX_LOG_LINES:
-                    self.log_text.delete("1.0", f"{lines - MAX_LOG_LINES}.0")
-            except Exception:
-                pass
-
-            self.log_text.see("end")
-            self.log_text.configure(state="disabled")
-        except Exception:
-            pass  # Hata olsa bile aşağıdaki after() her zaman çalışır
-        finally:
-            self.root.after(UPDATE_MS, self._update_log)
+                kind, payload = self.log_queue.popleft()
+            except IndexError:
+                break
+
+            if kind == "SYS":
+                rows.append(((ts, "", payload, "", ""), "sys"))
+            elif kind == "ERROR":
+                rows.append(((ts, "", f"!! {payload}", "", ""), "error"))
+            else:
+                # payload listener thread'inde biçimlendirildi
+                cols, tag = payload
+                rows.append(((ts, *cols), tag))
+
+        if not rows:
+            return
 
-    def _update_graphs(self):
-        """Grafikleri güncelle."""
         try:
-            times, rpm, temp, torque, curr, volt, latest = self.store.snapshot()
-
-            if len(times) < 2:
-                return
-
-            t_arr = np.array(times)
-            now   = time.time()
-            mask  = t_arr >= (now - WINDOW_SECONDS)
+            items = self._log_items
+            for values, tag in rows:
+                items.append(self.log_tree.insert("", "end", values=values, tags=(tag,)))
 
-            if mask.sum() < 2:
-                return
+            # Satır sınırı — id'ler Python'da tutulur, get_children çağrılmaz
+            excess = len(items) - MAX_LOG_LINES
+            if excess > 0:
+                self.log_tree.delete(*[items.popleft() for _ in range(excess)])
 
-            t_rel = t_arr[mask] - t_arr[mask][0]
-            series = [
-                np.array(rpm)[mask],
-                np.array(temp)[mask],
-                np.array(torque)[mask],
-                np.array(curr)[mask],
-            ]
+            self.log_tree.see(items[-1])
+        except tk.TclError:
+            pass  # Pencere kapanırken widget yok edilmiş olabilir
 
-            # Snapshot al, iterasyon sırasında self.axes'i değiştirme
-            axes_snapshot = list(self.axes)
-            new_axes = []
-
-            for i, (line, ax_info) in enumerate(zip(self.lines, axes_snapshot)):
-                ax, unit, ylim, color, old_fill = ax_info
-                s = series[i]
-
-                if len(s) == 0:
-                    new_axes.append(ax_info)
-                    continue
-
-                line.set_data(t_rel, s)
-                ax.set_xlim(0, max(t_rel[-1], 10))
-
-                # Dinamik Y aralığı — gerçek veriyi tam göster
-                data_min = float(s.min())
-                data_max = float(s.max())
-                margin = max((data_max - data_min) * 0.10, 0.5)
-                lo = max(0.0, data_min - margin)
-                hi = data_max + margin
+    def _update_graphs(self, snap):
+        """Grafikleri güncelle."""
+        times, rpm, temp, torque, curr, volt, latest = snap
+
+        # snapshot zaten sadece WINDOW_SECONDS penceresini içerir
+        if len(times) < 2:
+            return
+
+        t_rel = times - times[0]
+        series = [rpm, temp, torque, curr]
+
+        limits_changed = False
+        x_hi = max(10.0, math.ceil(t_rel[-1] / 10.0) * 10.0)
+
+        # Piksel sayısından fazla nokta görsel bilgi katmaz: adımla seyrelt,
+        # son (en yeni) örnek her zaman çizilsin diye başlangıç kaydırılır
+        step = -(-len(t_rel) // MAX_PLOT_POINTS)
+        pick = slice((len(t_rel) - 1) % step, None, step)
+        t_plot = t_rel[pick]
+        # Fill poligonunun alt kenarı: zaman ters sırada, y = 0
+        t_back = t_plot[::-1]
+        zeros  = np.zeros(len(t_plot))
+
+        for slot, s in zip(self.axes, series):
+            ax = slot.ax
+            s_plot = s[pick]
+            slot.line.set_data(t_plot, s_plot)
+
+            # Eksen limitleri değişirse tam çizim gerekir; X 10 s'lik
+            # adımlarla büyür, Y yalnızca veri taşınca / çok daralınca değişir
+            if ax.get_xlim()[1] != x_hi:
+                ax.set_xlim(0, x_hi)
+                limits_changed = True
+
+            # Limitler seyreltilmemiş seriden — tepe değerler kaçmasın
+            data_min = float(s.min())
+            data_max = float(s.max())
+            margin = max((data_max - data_min) * 0.10, 0.5)
+            lo = max(0.0, data_min - margin)
+            hi = data_max + margin
+            cur_lo, cur_hi = ax.get_ylim()
+            if (data_min < cur_lo or data_max > cur_hi
+                    or (cur_hi - cur_lo) > Y_SHRINK_RATIO * (hi - lo)):
                 ax.set_ylim(lo, hi)
+                limits_changed = True
 
-                # Fill alanı: eski'yi kaldır, yeni çiz
-                try:
-                    old_fill.remove()
-                except Exception:
-                    pass
-                new_fill = ax.fill_between(t_rel, s, alpha=0.12, color=color)
-                new_axes.append((ax, unit, ylim, color, new_fill))
-
-            # Güncellenmiş axes listesini tek seferde ata
-            self.axes = new_axes
-            self.canvas.draw_idle()
+            # Fill alanı: aynı PolyCollection'ın köşelerini yerinde güncelle
+            slot.fill.set_verts([np.column_stack((np.concatenate((t_plot, t_back)),
+                                                  np.concatenate((s_plot, zeros))))])
 
-        except Exception:
-            pass  # Hata olsa bile after() her zaman çalışır
-        finally:
-            self.root.after(UPDATE_MS, self._update_graphs)
-
-    def _update_kpis(self):
+        try:
+            if limits_changed or self._backgrounds is None:
+                self.canvas.draw_idle()   # draw_event → _on_draw arka planı yeniler
+            else:
+                for bg, slot in zip(self._backgrounds, self.axes):
+                    self.canvas.restore_region(bg)
+                    slot.ax.draw_artist(slot.fill)
+                    slot.ax.draw_artist(slot.line)
+                    self.canvas.blit(slot.ax.bbox)
+        except tk.TclError:
+            pass  # Pencere kapanırken canvas yok edilmiş olabilir
+
+    def _update_kpis(self, latest):
         """Üst KPI kartlarını güncelle."""
         try:
-            _, _, _, _, _, _, latest = self.store.snapshot()
             self.kpi_vars["rpm_var"].set(f"{latest['rpm']:.0f}")
             self.kpi_vars["temp_var"].set(f"{latest['temp']:.1f}")
             self.kpi_vars["torque_var"].set(f"{latest['torque']:.2f}")
@@ -490,18 +638,6 @@ class CANAnalyzerApp:
             self.kpi_vars["frame_var"].set(f"{latest['total_frames']}")
         except Exception:
             pass
-        finally:
-            self.root.after(500, self._update_kpis)
-
-    def _id_to_signal(self, can_id: int) -> str:
-        return {
-            CAN_ID_RPM:     "Motor RPM",
-            CAN_ID_TEMP:    "Sıcaklık",
-            CAN_ID_TORQUE:  "Tork",
-            CAN_ID_VOLTAGE: "DC Gerilim",
-            CAN_ID_CURRENT: "Faz Akımı",
-            CAN_ID_ERROR:   "⚠ HATA",
-        }.get(can_id, f"ID:0x{can_id:03X}")
 
     def on_close(self):
         self.stop_event.set()
@@ -521,6 +657,18 @@ def main():
                     background=BG_PANEL,
                     troughcolor=BG_DARK,
                     arrowcolor=FG_DIM)
+    style.configure("Log.Treeview",
+                    background=BG_DARK,
+                    fieldbackground=BG_DARK,
+                    foreground=FG_WHITE,
+                    font=("Consolas", 9),
+                    rowheight=18,
+                    borderwidth=0)
+    style.configure("Log.Treeview.Heading",
+                    background=BG_PANEL,
+                    foreground=FG_DIM,
+                    font=("Consolas", 8, "bold"),
+                    relief="flat")
 
     app = CANAnalyzerApp(root)
     root.protocol("WM_DELETE_WINDOW", app.on_close)